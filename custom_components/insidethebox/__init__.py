@@ -2,10 +2,12 @@ from __future__ import annotations
 
 import logging
 import secrets
+from datetime import datetime, timedelta
 from typing import Any
 from urllib.parse import urlparse
 
 from aiohttp import web
+import voluptuous as vol
 
 from homeassistant.components.webhook import (
     async_generate_id as webhook_generate_id,
@@ -15,21 +17,35 @@ from homeassistant.components.webhook import (
 )
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant, ServiceCall
+from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers.aiohttp_client import async_get_clientsession
+from homeassistant.helpers.event import async_call_later
 
-from .api import InsideTheBoxClient
+from . import profiler
+from .analytics import InsideTheBoxAnalytics, async_remove_store
+from .pyinsidethebox import InsideTheBoxClient
 from .const import (
     API_BASE,
+    CONF_SCAN_INTERVAL,
     CONF_TOKEN,
     CONF_WEBHOOK_ID,
     CONF_WEBHOOK_SECRET,
-    DEFAULT_OPEN_DURATION,
+    DEFAULT_PROFILE_DURATION,
+    DEFAULT_SCAN_INTERVAL,
     DOMAIN,
+    MAX_PROFILE_DURATION,
+    SERVICE_PROFILE,
     SERVICE_REREGISTER_WEBHOOKS,
     WEBHOOK_EVENT_NAME,
     WEBHOOK_HEADER_NAME,
+    WEBHOOK_RATE_BURST,
+    WEBHOOK_RATE_REFILL_PER_S,
 )
 from .coordinator import InsideTheBoxCoordinator
+from .descriptions import ENTITY_PROFILES
+from .entity import split_descriptions
+from .ratelimit import SourceRateLimiter
+from .webhook_handler import apply_payload, async_check_request
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -72,40 +88,29 @@ async def _ensure_webhook_ids(hass: HomeAssistant, entry: ConfigEntry) -> tuple[
 
 
 def _make_webhook_handler(hass: HomeAssistant, entry_id: str):
+    @profiler.profiled_async
     async def _handler(hass: HomeAssistant, webhook_id: str, request):
-        secret_expected = hass.data[DOMAIN][entry_id]["webhook_secret"]
-        got = request.headers.get(WEBHOOK_HEADER_NAME, "")
-        if not got or got != secret_expected:
-            return web.Response(status=401, text="unauthorized")
+        ctx = hass.data[DOMAIN][entry_id]
 
-        payload = await request.json()
+        payload = await async_check_request(
+            request, ctx["webhook_secret"], ctx["webhook_limiter"], ctx["webhook_stats"]
+        )
+        if isinstance(payload, web.Response):
+            return payload
 
         # Fire HA event for automations
         hass.bus.async_fire(WEBHOOK_EVENT_NAME, payload)
 
         # Push-update coordinator data (best-effort)
-        coordinator: InsideTheBoxCoordinator = hass.data[DOMAIN][entry_id]["coordinator"]
-
-        lock_obj = (
-            payload.get("deliveryLock")
-            or payload.get("lock")
-            or payload.get("webhookDevice")
-            or None
-        )
+        coordinator: InsideTheBoxCoordinator = ctx["coordinator"]
 
-        if isinstance(lock_obj, dict) and lock_obj.get("lockid"):
-            data = coordinator.data or {}
-            locks = list(data.get("locks", []))
-            updated = False
-            for i, obj in enumerate(locks):
-                if obj.get("lockid") == lock_obj["lockid"]:
-                    locks[i] = {**obj, **lock_obj}
-                    updated = True
-                    break
-            if not updated:
-                locks.append(lock_obj)
+        data, events = apply_payload(coordinator.data or {}, payload)
 
-            coordinator.async_set_updated_data({**data, "locks": locks})
+        if events:
+            # Update entities first so automations triggered by the typed events see fresh state
+            coordinator.async_set_updated_data(data)
+            for event, event_data in events:
+                hass.bus.async_fire(event, {"entry_id": entry_id, **event_data})
 
         return web.Response(status=200)
 
@@ -166,18 +171,30 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     session = async_get_clientsession(hass)
     client = InsideTheBoxClient(session, token, API_BASE)
 
-    coordinator = InsideTheBoxCoordinator(hass, client)
+    coordinator = InsideTheBoxCoordinator(
+        hass, client, entry.options.get(CONF_SCAN_INTERVAL, DEFAULT_SCAN_INTERVAL), config_entry=entry
+    )
     await coordinator.async_config_entry_first_refresh()
 
     webhook_id, webhook_secret = await _ensure_webhook_ids(hass, entry)
 
+    # Analytics must subscribe before the platforms so sensors read fresh usage state
+    analytics = InsideTheBoxAnalytics(hass, entry.entry_id, coordinator)
+    await analytics.async_load()
+    entry.async_on_unload(analytics.async_start())
+
     hass.data[DOMAIN][entry.entry_id] = {
         "client": client,
         "coordinator": coordinator,
-        "default_open_duration": DEFAULT_OPEN_DURATION,
+        "analytics": analytics,
+        "entity_profile": _entity_profile(entry),
         "webhook_id": webhook_id,
         "webhook_secret": webhook_secret,
         "remote_webhooks": {},  # lockid -> webhookid
+        "webhook_stats": dict.fromkeys(
+            ("accepted", "unauthorized", "too_large", "invalid_json", "rate_limited"), 0
+        ),
+        "webhook_limiter": SourceRateLimiter(WEBHOOK_RATE_BURST, WEBHOOK_RATE_REFILL_PER_S),
     }
 
     # Register HA webhook handler
@@ -228,14 +245,85 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
 
         hass.services.async_register(DOMAIN, SERVICE_REREGISTER_WEBHOOKS, _svc_reregister)
 
+    if not hass.services.has_service(DOMAIN, SERVICE_PROFILE):
+
+        async def _svc_profile(call: ServiceCall):
+            if profiler.is_active():
+                raise HomeAssistantError("An Inside The Box profiling session is already running")
+
+            duration: int = call.data["duration"]
+            path = hass.config.path(f"insidethebox_profile_{datetime.now().strftime('%Y%m%d_%H%M%S')}.prof")
+            try:
+                profiler.start()
+            except RuntimeError as e:
+                raise HomeAssistantError(str(e)) from e
+            _LOGGER.info("Profiling Inside The Box for %s seconds", duration)
+
+            async def _finish(_now) -> None:
+                stats = profiler.stop()
+                if stats is None:
+                    if profiler.had_conflict():
+                        _LOGGER.warning("Profiling finished without data: another profiler was active")
+                    else:
+                        _LOGGER.info("Profiling finished: no integration code ran")
+                    return
+                if profiler.had_conflict():
+                    _LOGGER.warning("Another profiler was active during the session; %s is incomplete", path)
+                await hass.async_add_executor_job(profiler.write_stats, stats, path)
+                _LOGGER.info("Profiling finished, stats written to %s", path)
+
+            async_call_later(hass, duration, _finish)
+
+        hass.services.async_register(
+            DOMAIN,
+            SERVICE_PROFILE,
+            _svc_profile,
+            schema=vol.Schema(
+                {
+                    vol.Optional("duration", default=DEFAULT_PROFILE_DURATION): vol.All(
+                        vol.Coerce(int), vol.Range(min=1, max=MAX_PROFILE_DURATION)
+                    ),
+                }
+            ),
+        )
+
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
+    entry.async_on_unload(entry.add_update_listener(_async_options_updated))
     return True
 
 
+def _entity_profile(entry: ConfigEntry) -> dict[str, set[str]]:
+    """Effective entity selection per options key (an unset option means all keys)."""
+    return {
+        option: {d.key for d in split_descriptions(entry, option, descriptions)[0]}
+        for option, descriptions in ENTITY_PROFILES.items()
+    }
+
+
+async def _async_options_updated(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Apply options; only a changed entity profile needs a reload."""
+    ctx = hass.data[DOMAIN][entry.entry_id]
+
+    if _entity_profile(entry) != ctx["entity_profile"]:
+        await hass.config_entries.async_reload(entry.entry_id)
+        return
+
+    coordinator: InsideTheBoxCoordinator = ctx["coordinator"]
+    interval = timedelta(seconds=entry.options.get(CONF_SCAN_INTERVAL, DEFAULT_SCAN_INTERVAL))
+    if coordinator.update_interval != interval:
+        coordinator.update_interval = interval
+        # Refresh now so the next poll is scheduled with the new interval
+        await coordinator.async_request_refresh()
+
+
 async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     data = hass.data[DOMAIN].get(entry.entry_id, {})
     client: InsideTheBoxClient | None = data.get("client")
     remote_map: dict[str, str] = data.get("remote_webhooks", {}) or {}
+    analytics: InsideTheBoxAnalytics | None = data.get("analytics")
+
+    if analytics:
+        await analytics.async_save()
 
     # Remove ITB webhooks for this entry (best-effort)
     if client and remote_map:
@@ -255,8 +343,14 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     if unload_ok:
         hass.data[DOMAIN].pop(entry.entry_id, None)
 
-        # If last entry removed, also remove service
-        if not hass.data[DOMAIN] and hass.services.has_service(DOMAIN, SERVICE_REREGISTER_WEBHOOKS):
-            hass.services.async_remove(DOMAIN, SERVICE_REREGISTER_WEBHOOKS)
+        # If last entry removed, also remove services
+        if not hass.data[DOMAIN]:
+            for service in (SERVICE_REREGISTER_WEBHOOKS, SERVICE_PROFILE):
+                if hass.services.has_service(DOMAIN, service):
+                    hass.services.async_remove(DOMAIN, service)
+
+    return unload_ok
+
 
-    return unload_ok
\ No newline at end of file
+async def async_remove_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    await async_remove_store(hass, entry.entry_id)
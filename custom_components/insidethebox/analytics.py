@@ -0,0 +1,86 @@
+from __future__ import annotations
+
+import logging
+from dataclasses import asdict
+from typing import Any, Callable
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.storage import Store
+from homeassistant.util import dt as dt_util
+
+from .const import ANALYTICS_SAVE_DELAY, DOMAIN
+from .coordinator import InsideTheBoxCoordinator
+from .usage import LockUsage
+
+_LOGGER = logging.getLogger(__name__)
+
+STORAGE_VERSION = 1
+
+
+def _store(hass: HomeAssistant, entry_id: str) -> Store[dict[str, Any]]:
+    return Store(hass, STORAGE_VERSION, f"{DOMAIN}.{entry_id}.analytics")
+
+
+async def async_remove_store(hass: HomeAssistant, entry_id: str) -> None:
+    """Delete the persisted analytics state of a removed config entry."""
+    await _store(hass, entry_id).async_remove()
+
+
+class InsideTheBoxAnalytics:
+    """Keeps LockUsage per lock up to date from coordinator updates and persists it."""
+
+    def __init__(self, hass: HomeAssistant, entry_id: str, coordinator: InsideTheBoxCoordinator) -> None:
+        self._coordinator = coordinator
+        self._store = _store(hass, entry_id)
+        self.locks: dict[str, LockUsage] = {}
+
+    async def async_load(self) -> None:
+        data = await self._store.async_load() or {}
+        self.locks = {
+            lockid: LockUsage.from_dict(state)
+            for lockid, state in (data.get("locks") or {}).items()
+        }
+
+    async def async_save(self) -> None:
+        await self._store.async_save(self._data_to_save())
+
+    @callback
+    def async_start(self) -> Callable[[], None]:
+        """Subscribe to coordinator updates.
+
+        Must run before the platforms are set up so the usage state is updated
+        before the analytics sensors read it.
+        """
+        self._handle_update()
+        return self._coordinator.async_add_listener(self._handle_update)
+
+    def get(self, lockid: str) -> LockUsage | None:
+        return self.locks.get(lockid)
+
+    @callback
+    def _handle_update(self) -> None:
+        now = dt_util.now()
+        changed = False
+        seen: set[str] = set()
+        for obj in (self._coordinator.data or {}).get("locks", []):
+            lockid = obj.get("lockid")
+            if not lockid:
+                continue
+            seen.add(lockid)
+            usage = self.locks.get(lockid)
+            if usage is None:
+                usage = self.locks[lockid] = LockUsage()
+            changed = usage.observe(obj, now) or changed
+
+        # Forget locks that are gone from the account so the stored state stays bounded
+        if self._coordinator.data is not None:
+            for lockid in self.locks.keys() - seen:
+                del self.locks[lockid]
+                changed = True
+
+        if changed:
+            self._store.async_delay_save(self._data_to_save, ANALYTICS_SAVE_DELAY)
+
+    @callback
+    def _data_to_save(self) -> dict[str, Any]:
+        return {"locks": {lockid: asdict(usage) for lockid, usage in self.locks.items()}}
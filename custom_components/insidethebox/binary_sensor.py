@@ -1,64 +1,35 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
-from typing import Any, Callable
+from typing import Any
 
-from homeassistant.components.binary_sensor import (
-    BinarySensorEntity,
-    BinarySensorEntityDescription,
-)
+from homeassistant.components.binary_sensor import BinarySensorEntity
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
-from .const import DOMAIN
+from .const import CONF_LOCK_BINARY_SENSORS, DOMAIN
 from .coordinator import InsideTheBoxCoordinator
-
-
-ACCESSIBLE_TRUE = {"ACCESSIBLE", "ACCESSIBLE_REMOTELY"}
-ACTIVE_TRUE = {"ACTIVE"}
-
-
-@dataclass(frozen=True, kw_only=True)
-class ITBBinaryDescription(BinarySensorEntityDescription):
-    value_fn: Callable[[dict[str, Any]], bool | None]
-
-
-LOCK_BINARY_SENSORS: list[ITBBinaryDescription] = [
-    ITBBinaryDescription(
-        key="accessible",
-        name="Accessible",
-        icon="mdi:shield-check",
-        value_fn=lambda o: (o.get("lockAccessibilityState") in ACCESSIBLE_TRUE)
-        if o.get("lockAccessibilityState") is not None
-        else None,
-    ),
-    ITBBinaryDescription(
-        key="active",
-        name="Active",
-        icon="mdi:power",
-        value_fn=lambda o: (o.get("state") in ACTIVE_TRUE) if o.get("state") is not None else None,
-    ),
-    ITBBinaryDescription(
-        key="open",
-        name="Open",
-        icon="mdi:door-open",
-        value_fn=lambda o: bool(o.get("isLockOpen")) if o.get("isLockOpen") is not None else None,
-    ),
-]
+from .descriptions import ITBBinaryDescription, LOCK_BINARY_SENSORS
+from .entity import async_remove_entities, split_descriptions
+from .profiler import profiled
 
 
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry, async_add_entities) -> None:
     ctx = hass.data[DOMAIN][entry.entry_id]
     coordinator: InsideTheBoxCoordinator = ctx["coordinator"]
 
+    selected, dropped = split_descriptions(entry, CONF_LOCK_BINARY_SENSORS, LOCK_BINARY_SENSORS)
+
     entities: list[BinarySensorEntity] = []
+    dropped_ids: list[str] = []
     for lock_obj in (coordinator.data or {}).get("locks", []):
         lockid = lock_obj.get("lockid")
         name = lock_obj.get("name") or lock_obj.get("description") or lockid
-        for desc in LOCK_BINARY_SENSORS:
+        for desc in selected:
             entities.append(InsideTheBoxLockBinarySensor(coordinator, lockid, name, desc))
+        dropped_ids.extend(f"insidethebox_lock_{lockid}_{d.key}" for d in dropped)
 
+    async_remove_entities(hass, "binary_sensor", dropped_ids)
     async_add_entities(entities)
 
 
@@ -86,6 +57,7 @@ class InsideTheBoxLockBinarySensor(CoordinatorEntity[InsideTheBoxCoordinator], B
         return None
 
     @property
+    @profiled
     def is_on(self) -> bool | None:
         lock = self._find_lock() or {}
         return self.entity_description.value_fn(lock)
\ No newline at end of file
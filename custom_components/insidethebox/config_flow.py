@@ -4,12 +4,24 @@ import logging
 import voluptuous as vol
 
 from homeassistant import config_entries
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.data_entry_flow import FlowResult
+from homeassistant.helpers import config_validation as cv
 from homeassistant.helpers.aiohttp_client import async_get_clientsession
 
-from .api import InsideTheBoxClient, InsideTheBoxApiError, InsideTheBoxAuthError
-from .const import API_BASE, CONF_TOKEN, DOMAIN
+from .pyinsidethebox import InsideTheBoxClient, InsideTheBoxApiError, InsideTheBoxAuthError
+from .const import (
+    API_BASE,
+    CONF_OPEN_DURATION,
+    CONF_SCAN_INTERVAL,
+    CONF_TOKEN,
+    DEFAULT_OPEN_DURATION,
+    DEFAULT_SCAN_INTERVAL,
+    DOMAIN,
+    MAX_SCAN_INTERVAL,
+    MIN_SCAN_INTERVAL,
+)
+from .descriptions import ENTITY_PROFILES
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -23,6 +35,11 @@ async def _validate(hass: HomeAssistant, token: str) -> None:
 class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
     VERSION = 1
 
+    @staticmethod
+    @callback
+    def async_get_options_flow(config_entry: config_entries.ConfigEntry) -> OptionsFlow:
+        return OptionsFlow()
+
     async def async_step_user(self, user_input=None) -> FlowResult:
         errors = {}
 
@@ -48,4 +65,27 @@ class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
             step_id="user",
             data_schema=vol.Schema({vol.Required(CONF_TOKEN): str}),
             errors=errors,
-        )
\ No newline at end of file
+        )
+
+
+class OptionsFlow(config_entries.OptionsFlow):
+    async def async_step_init(self, user_input=None) -> FlowResult:
+        if user_input is not None:
+            return self.async_create_entry(title="", data=user_input)
+
+        options = self.config_entry.options
+        schema: dict = {
+            vol.Required(
+                CONF_SCAN_INTERVAL,
+                default=options.get(CONF_SCAN_INTERVAL, DEFAULT_SCAN_INTERVAL),
+            ): vol.All(vol.Coerce(int), vol.Range(min=MIN_SCAN_INTERVAL, max=MAX_SCAN_INTERVAL)),
+            vol.Required(
+                CONF_OPEN_DURATION,
+                default=options.get(CONF_OPEN_DURATION, DEFAULT_OPEN_DURATION),
+            ): vol.All(vol.Coerce(int), vol.Range(min=0, max=25)),
+        }
+        for option, descriptions in ENTITY_PROFILES.items():
+            choices = {d.key: d.name for d in descriptions}
+            schema[vol.Required(option, default=options.get(option, list(choices)))] = cv.multi_select(choices)
+
+        return self.async_show_form(step_id="init", data_schema=vol.Schema(schema))
\ No newline at end of file
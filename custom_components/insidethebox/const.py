@@ -1,3 +1,6 @@
+# API endpoint and the device fields kept from /devices live in the HA-free SDK
+from .pyinsidethebox.const import API_BASE, GATEWAY_FIELDS, LOCK_FIELDS  # noqa: F401
+
 DOMAIN = "insidethebox"
 
 CONF_TOKEN = "token"
@@ -6,12 +9,41 @@ CONF_TOKEN = "token"
 CONF_WEBHOOK_ID = "webhook_id"
 CONF_WEBHOOK_SECRET = "webhook_secret"
 
-API_BASE = "https://api.insidethebox.se/iotapi"
+# Stored in entry.options
+CONF_SCAN_INTERVAL = "scan_interval"
+CONF_OPEN_DURATION = "open_duration"
+# Entity description keys to create per device type (missing = all)
+CONF_LOCK_SENSORS = "lock_sensors"
+CONF_LOCK_BINARY_SENSORS = "lock_binary_sensors"
+CONF_GATEWAY_SENSORS = "gateway_sensors"
 
 WEBHOOK_HEADER_NAME = "X-ITB-Webhook-Secret"
 WEBHOOK_EVENT_NAME = "insidethebox_webhook"
 
+WEBHOOK_MAX_BODY_BYTES = 64 * 1024
+# Unauthenticated webhook requests per source before they get 429 instead of 401, and refill rate
+WEBHOOK_RATE_BURST = 20
+WEBHOOK_RATE_REFILL_PER_S = 0.5
+
+# Typed events fired per webhook payload kind
+EVENT_LOCK_OPENED = "insidethebox_lock_opened"
+EVENT_LOCK_CLOSED = "insidethebox_lock_closed"
+EVENT_LOCK_UPDATED = "insidethebox_lock_updated"
+EVENT_GATEWAY_CONNECTION_CHANGED = "insidethebox_gateway_connection_changed"
+EVENT_GATEWAY_UPDATED = "insidethebox_gateway_updated"
+
 DEFAULT_SCAN_INTERVAL = 300  # seconds
+MIN_SCAN_INTERVAL = 30
+MAX_SCAN_INTERVAL = 3600
 DEFAULT_OPEN_DURATION = 15   # seconds (0..25 supported by API)
 
-SERVICE_REREGISTER_WEBHOOKS = "reregister_webhooks"
\ No newline at end of file
+# Usage/battery analytics
+ANALYTICS_EMA_ALPHA = 0.2     # weight of the newest open duration in the moving average
+ANALYTICS_SAVE_DELAY = 60     # seconds; running state is written at most this often
+BATTERY_REPLACED_JUMP = 10    # % rise in battery level treated as a battery swap
+
+SERVICE_REREGISTER_WEBHOOKS = "reregister_webhooks"
+SERVICE_PROFILE = "profile"
+
+DEFAULT_PROFILE_DURATION = 60  # seconds
+MAX_PROFILE_DURATION = 3600
\ No newline at end of file
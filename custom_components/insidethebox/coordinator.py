@@ -3,11 +3,13 @@ from __future__ import annotations
 from datetime import timedelta
 from typing import Any
 
+from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
 
-from .api import InsideTheBoxClient, InsideTheBoxApiError
-from .const import DOMAIN, DEFAULT_SCAN_INTERVAL
+from .pyinsidethebox import InsideTheBoxClient, InsideTheBoxApiError
+from .const import DOMAIN, DEFAULT_SCAN_INTERVAL, GATEWAY_FIELDS, LOCK_FIELDS
+from .profiler import profiled_async
 
 
 class InsideTheBoxCoordinator(DataUpdateCoordinator[dict[str, Any]]):
@@ -16,22 +18,23 @@ class InsideTheBoxCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         hass: HomeAssistant,
         client: InsideTheBoxClient,
         scan_interval_s: int = DEFAULT_SCAN_INTERVAL,
+        config_entry: ConfigEntry | None = None,
     ) -> None:
         super().__init__(
             hass,
             logger=__import__("logging").getLogger(__name__),
+            config_entry=config_entry,
             name=DOMAIN,
             update_interval=timedelta(seconds=scan_interval_s),
         )
         self.client = client
 
+    @profiled_async
     async def _async_update_data(self) -> dict[str, Any]:
         try:
-            data = await self.client.get_devices()
+            return await self.client.get_device_records(
+                lock_fields=LOCK_FIELDS,
+                gateway_fields=GATEWAY_FIELDS,
+            )
         except InsideTheBoxApiError as e:
-            raise UpdateFailed(str(e)) from e
-
-        # Normalize null -> []
-        data["locks"] = data.get("locks") or []
-        data["gateways"] = data.get("gateways") or []
-        return data
\ No newline at end of file
+            raise UpdateFailed(str(e)) from e
\ No newline at end of file
@@ -0,0 +1,147 @@
+"""Entity descriptions for all platforms, and the per-device-type profiles
+the options flow selects from. Kept free of platform imports so the config
+flow and setup can use them without loading the platforms."""
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Any, Callable
+
+from homeassistant.components.binary_sensor import BinarySensorEntityDescription
+from homeassistant.components.sensor import (
+    SensorDeviceClass,
+    SensorEntityDescription,
+    SensorStateClass,
+)
+from homeassistant.const import UnitOfTime
+from homeassistant.util import dt as dt_util
+
+from .const import CONF_GATEWAY_SENSORS, CONF_LOCK_BINARY_SENSORS, CONF_LOCK_SENSORS
+from .usage import LockUsage
+
+
+@dataclass(frozen=True, kw_only=True)
+class ITBSensorEntityDescription(SensorEntityDescription):
+    value_fn: Callable[[dict[str, Any]], Any]
+
+
+LOCK_SENSORS: list[ITBSensorEntityDescription] = [
+    ITBSensorEntityDescription(
+        key="lockBatteryLevel",
+        name="Battery level",
+        icon="mdi:battery",
+        native_unit_of_measurement="%",
+        value_fn=lambda o: int(o["lockBatteryLevel"]) if o.get("lockBatteryLevel") is not None else None,
+    ),
+    ITBSensorEntityDescription(
+        key="lockAccessibilityState",
+        name="Accessibility state",
+        icon="mdi:shield-lock",
+        value_fn=lambda o: o.get("lockAccessibilityState"),
+    ),
+    ITBSensorEntityDescription(
+        key="state",
+        name="State",
+        icon="mdi:information-outline",
+        value_fn=lambda o: o.get("state"),
+    ),
+    ITBSensorEntityDescription(
+        key="lastLockOpenOrCloseTimestamp",
+        name="Last open/close",
+        icon="mdi:clock-outline",
+        value_fn=lambda o: o.get("lastLockOpenOrCloseTimestamp"),
+    ),
+]
+
+
+@dataclass(frozen=True, kw_only=True)
+class ITBAnalyticsSensorEntityDescription(SensorEntityDescription):
+    value_fn: Callable[[LockUsage], Any]
+
+
+LOCK_ANALYTICS_SENSORS: list[ITBAnalyticsSensorEntityDescription] = [
+    ITBAnalyticsSensorEntityDescription(
+        key="opens_today",
+        name="Opens today",
+        icon="mdi:counter",
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        value_fn=lambda u: u.opens_on(dt_util.now().date()),
+    ),
+    ITBAnalyticsSensorEntityDescription(
+        key="mean_open_duration",
+        name="Mean open duration",
+        icon="mdi:timer-outline",
+        device_class=SensorDeviceClass.DURATION,
+        state_class=SensorStateClass.MEASUREMENT,
+        native_unit_of_measurement=UnitOfTime.SECONDS,
+        value_fn=lambda u: round(u.mean_open_duration, 1) if u.mean_open_duration is not None else None,
+    ),
+    ITBAnalyticsSensorEntityDescription(
+        key="battery_depletion",
+        name="Estimated battery depletion",
+        icon="mdi:battery-clock",
+        device_class=SensorDeviceClass.TIMESTAMP,
+        value_fn=lambda u: u.battery_depletion(),
+    ),
+]
+
+GATEWAY_SENSORS: list[ITBSensorEntityDescription] = [
+    ITBSensorEntityDescription(
+        key="gatewayConnectionStatus",
+        name="Connection",
+        icon="mdi:lan-connect",
+        value_fn=lambda o: o.get("gatewayConnectionStatus"),
+    ),
+    ITBSensorEntityDescription(
+        key="gatewayConnectionChangedTimestamp",
+        name="Connection changed",
+        icon="mdi:clock-outline",
+        value_fn=lambda o: o.get("gatewayConnectionChangedTimestamp"),
+    ),
+    ITBSensorEntityDescription(
+        key="state",
+        name="State",
+        icon="mdi:information-outline",
+        value_fn=lambda o: o.get("state"),
+    ),
+]
+
+
+ACCESSIBLE_TRUE = {"ACCESSIBLE", "ACCESSIBLE_REMOTELY"}
+ACTIVE_TRUE = {"ACTIVE"}
+
+
+@dataclass(frozen=True, kw_only=True)
+class ITBBinaryDescription(BinarySensorEntityDescription):
+    value_fn: Callable[[dict[str, Any]], bool | None]
+
+
+LOCK_BINARY_SENSORS: list[ITBBinaryDescription] = [
+    ITBBinaryDescription(
+        key="accessible",
+        name="Accessible",
+        icon="mdi:shield-check",
+        value_fn=lambda o: (o.get("lockAccessibilityState") in ACCESSIBLE_TRUE)
+        if o.get("lockAccessibilityState") is not None
+        else None,
+    ),
+    ITBBinaryDescription(
+        key="active",
+        name="Active",
+        icon="mdi:power",
+        value_fn=lambda o: (o.get("state") in ACTIVE_TRUE) if o.get("state") is not None else None,
+    ),
+    ITBBinaryDescription(
+        key="open",
+        name="Open",
+        icon="mdi:door-open",
+        value_fn=lambda o: bool(o.get("isLockOpen")) if o.get("isLockOpen") is not None else None,
+    ),
+]
+
+
+# Entity description lists selectable per options key
+ENTITY_PROFILES = {
+    CONF_LOCK_SENSORS: LOCK_SENSORS + LOCK_ANALYTICS_SENSORS,
+    CONF_LOCK_BINARY_SENSORS: LOCK_BINARY_SENSORS,
+    CONF_GATEWAY_SENSORS: GATEWAY_SENSORS,
+}
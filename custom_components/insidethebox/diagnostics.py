@@ -0,0 +1,28 @@
+from __future__ import annotations
+
+from typing import Any
+
+from homeassistant.components.diagnostics import async_redact_data
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant
+
+from .const import CONF_TOKEN, CONF_WEBHOOK_ID, CONF_WEBHOOK_SECRET, DOMAIN
+
+TO_REDACT = {CONF_TOKEN, CONF_WEBHOOK_ID, CONF_WEBHOOK_SECRET}
+
+
+async def async_get_config_entry_diagnostics(hass: HomeAssistant, entry: ConfigEntry) -> dict[str, Any]:
+    ctx = hass.data[DOMAIN][entry.entry_id]
+    data = ctx["coordinator"].data or {}
+
+    return {
+        "entry": {
+            "data": async_redact_data(dict(entry.data), TO_REDACT),
+            "options": dict(entry.options),
+        },
+        "locks": len(data.get("locks", [])),
+        "gateways": len(data.get("gateways", [])),
+        "remote_webhooks": len(ctx.get("remote_webhooks") or {}),
+        # Accepted/rejected counts for the public webhook endpoint since setup
+        "webhook_stats": dict(ctx["webhook_stats"]),
+    }
@@ -0,0 +1,34 @@
+from __future__ import annotations
+
+from typing import Iterable, Sequence, TypeVar
+
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers import entity_registry as er
+from homeassistant.helpers.entity import EntityDescription
+
+from .const import DOMAIN
+
+_DescT = TypeVar("_DescT", bound=EntityDescription)
+
+
+def split_descriptions(
+    entry: ConfigEntry, option: str, descriptions: Sequence[_DescT]
+) -> tuple[list[_DescT], list[_DescT]]:
+    """Return (selected, deselected) descriptions for an entity profile option."""
+    keys = entry.options.get(option)
+    if keys is None:
+        return list(descriptions), []
+    selected = [d for d in descriptions if d.key in keys]
+    deselected = [d for d in descriptions if d.key not in keys]
+    return selected, deselected
+
+
+@callback
+def async_remove_entities(hass: HomeAssistant, platform: str, unique_ids: Iterable[str]) -> None:
+    """Remove deselected entities from the registry so they don't linger as unavailable."""
+    registry = er.async_get(hass)
+    for unique_id in unique_ids:
+        entity_id = registry.async_get_entity_id(platform, DOMAIN, unique_id)
+        if entity_id:
+            registry.async_remove(entity_id)
@@ -7,27 +7,26 @@ from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
-from .const import DOMAIN
+from .const import CONF_OPEN_DURATION, DEFAULT_OPEN_DURATION, DOMAIN
 from .coordinator import InsideTheBoxCoordinator
+from .profiler import profiled
 
 
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry, async_add_entities) -> None:
     ctx = hass.data[DOMAIN][entry.entry_id]
     coordinator: InsideTheBoxCoordinator = ctx["coordinator"]
-    default_open_duration: int = ctx["default_open_duration"]
 
     locks = (coordinator.data or {}).get("locks", [])
-    async_add_entities([InsideTheBoxLock(coordinator, obj, default_open_duration) for obj in locks])
+    async_add_entities([InsideTheBoxLock(coordinator, obj) for obj in locks])
 
 
 class InsideTheBoxLock(CoordinatorEntity[InsideTheBoxCoordinator], LockEntity):
     _attr_has_entity_name = True
 
-    def __init__(self, coordinator: InsideTheBoxCoordinator, lock_obj: dict[str, Any], default_open_duration: int) -> None:
+    def __init__(self, coordinator: InsideTheBoxCoordinator, lock_obj: dict[str, Any]) -> None:
         super().__init__(coordinator)
         self._lockid = lock_obj.get("lockid")
         self._name = lock_obj.get("name") or lock_obj.get("description") or self._lockid
-        self._default_open_duration = default_open_duration
 
         self._attr_unique_id = f"insidethebox_lock_{self._lockid}"
         self._attr_name = self._name
@@ -45,6 +44,7 @@ class InsideTheBoxLock(CoordinatorEntity[InsideTheBoxCoordinator], LockEntity):
         return None
 
     @property
+    @profiled
     def is_locked(self) -> bool | None:
         obj = self._find_self()
         if not obj:
@@ -68,7 +68,9 @@ class InsideTheBoxLock(CoordinatorEntity[InsideTheBoxCoordinator], LockEntity):
         }
 
     async def async_unlock(self, **kwargs: Any) -> None:
-        duration = kwargs.get("open_duration_seconds", self._default_open_duration)
+        # Read on every call so option changes apply without a reload
+        default = self.coordinator.config_entry.options.get(CONF_OPEN_DURATION, DEFAULT_OPEN_DURATION)
+        duration = kwargs.get("open_duration_seconds", default)
         if duration is not None:
             duration = max(0, min(25, int(duration)))
 
@@ -0,0 +1,154 @@
+from __future__ import annotations
+
+import cProfile
+import functools
+import io
+import logging
+import pstats
+import sys
+import types
+from typing import Any, Callable, Coroutine, TypeVar
+
+_LOGGER = logging.getLogger(__name__)
+
+_T = TypeVar("_T")
+
+# The running session, or None. Wrapped functions only check this when disabled.
+_PROFILER: cProfile.Profile | None = None
+_DEPTH = 0
+# Set when another profiler owned the thread while the session wanted to record
+_CONFLICT = False
+
+
+def is_active() -> bool:
+    return _PROFILER is not None
+
+
+def had_conflict() -> bool:
+    """True if the last session skipped recording because another profiler was active."""
+    return _CONFLICT
+
+
+def start() -> None:
+    global _PROFILER, _DEPTH, _CONFLICT
+    if _PROFILER is not None:
+        raise RuntimeError("Profiling session already running")
+    # Python < 3.12 profilers use sys.setprofile; newer ones make enable() raise
+    conflict = sys.getprofile() is not None
+    if not conflict:
+        probe = cProfile.Profile()
+        try:
+            probe.enable()
+        except ValueError:
+            conflict = True
+        else:
+            probe.disable()
+    if conflict:
+        raise RuntimeError("Another profiler is already active (e.g. the profiler integration)")
+    _PROFILER = cProfile.Profile()
+    _DEPTH = 0
+    _CONFLICT = False
+
+
+def stop() -> pstats.Stats | None:
+    """End the session and return the aggregated stats (None if nothing was recorded)."""
+    global _PROFILER
+    prof, _PROFILER = _PROFILER, None
+    if prof is None:
+        return None
+    try:
+        return pstats.Stats(prof)
+    except TypeError:
+        # No profiled code ran during the session
+        return None
+
+
+def write_stats(stats: pstats.Stats, path: str) -> None:
+    """Write binary pstats to path and a text summary to path + '.txt' (blocking I/O)."""
+    stats.dump_stats(path)
+    out = io.StringIO()
+    stats.stream = out
+    stats.sort_stats(pstats.SortKey.CUMULATIVE).print_stats(50)
+    with open(f"{path}.txt", "w", encoding="utf-8") as f:
+        f.write(out.getvalue())
+
+
+def _enable() -> cProfile.Profile | None:
+    global _DEPTH, _CONFLICT
+    prof = _PROFILER
+    if prof is None:
+        return None
+    if _DEPTH == 0:
+        try:
+            if sys.getprofile() is not None:
+                raise ValueError("profile hook already set")
+            prof.enable()
+        except ValueError:
+            # Another profiler (e.g. HA's profiler integration) owns the thread
+            if not _CONFLICT:
+                _LOGGER.warning("Another profiler is active; Inside The Box profiling data will be incomplete")
+                _CONFLICT = True
+            return None
+    _DEPTH += 1
+    return prof
+
+
+def _disable(prof: cProfile.Profile) -> None:
+    global _DEPTH
+    _DEPTH -= 1
+    if _DEPTH == 0:
+        prof.disable()
+
+
+def profiled(func: Callable[..., _T]) -> Callable[..., _T]:
+    """Record func in the active profiling session; a single global check otherwise."""
+
+    @functools.wraps(func)
+    def _wrapper(*args: Any, **kwargs: Any) -> _T:
+        if _PROFILER is None:
+            return func(*args, **kwargs)
+        prof = _enable()
+        if prof is None:
+            return func(*args, **kwargs)
+        try:
+            return func(*args, **kwargs)
+        finally:
+            _disable(prof)
+
+    return _wrapper
+
+
+@types.coroutine
+def _drive(coro: Coroutine[Any, Any, _T]):
+    """Run coro, profiling only its slices on the event loop (not the awaits)."""
+    send_value: Any = None
+    throw_exc: BaseException | None = None
+    while True:
+        prof = _enable()
+        try:
+            if throw_exc is not None:
+                exc, throw_exc = throw_exc, None
+                yielded = coro.throw(exc)
+            else:
+                yielded = coro.send(send_value)
+        except StopIteration as e:
+            return e.value
+        finally:
+            if prof is not None:
+                _disable(prof)
+        try:
+            send_value = yield yielded
+        except BaseException as e:  # noqa: BLE001 - forwarded into the coroutine
+            throw_exc = e
+
+
+def profiled_async(func: Callable[..., Coroutine[Any, Any, _T]]) -> Callable[..., Coroutine[Any, Any, _T]]:
+    """Async variant of profiled(); time spent awaiting is not attributed to func."""
+
+    @functools.wraps(func)
+    async def _wrapper(*args: Any, **kwargs: Any) -> _T:
+        if _PROFILER is None:
+            return await func(*args, **kwargs)
+        return await _drive(func(*args, **kwargs))
+
+    return _wrapper
@@ -0,0 +1,22 @@
+"""Async client for the Inside The Box API, usable without Home Assistant.
+
+The integration imports it as ``.pyinsidethebox``; standalone, put the
+integration directory on ``sys.path`` and ``import pyinsidethebox``.
+"""
+from .api import (
+    InsideTheBoxApiError,
+    InsideTheBoxAuthError,
+    InsideTheBoxClient,
+    parse_devices_stream,
+)
+from .const import API_BASE, GATEWAY_FIELDS, LOCK_FIELDS
+
+__all__ = [
+    "API_BASE",
+    "GATEWAY_FIELDS",
+    "InsideTheBoxApiError",
+    "InsideTheBoxAuthError",
+    "InsideTheBoxClient",
+    "LOCK_FIELDS",
+    "parse_devices_stream",
+]
@@ -0,0 +1,327 @@
+from __future__ import annotations
+
+import asyncio
+import json
+import re
+from dataclasses import dataclass
+from typing import Any, AsyncIterator, Iterable, Optional
+
+import aiohttp
+
+from .const import API_BASE
+
+
+class InsideTheBoxApiError(Exception):
+    """Generic API error."""
+
+
+class InsideTheBoxAuthError(InsideTheBoxApiError):
+    """Auth error (401/403/452)."""
+
+
+_STRUCT_RE = re.compile(rb'[\[\]{}"]')
+_STRING_RE = re.compile(rb'["\\]')
+_SCALAR_END_RE = re.compile(rb"[,\]}\s]")
+_WS = b" \t\r\n"
+
+STREAM_CHUNK_SIZE = 16384
+
+
+class _JsonStream:
+    """Pull-based reader over a chunked JSON byte stream.
+
+    Values can be skipped without being buffered, or captured as raw bytes.
+    Only the bytes of the value currently being captured are held in memory.
+    """
+
+    def __init__(self, chunks: AsyncIterator[bytes]) -> None:
+        self._chunks = chunks.__aiter__()
+        self._buf = b""
+        self._pos = 0
+        self._eof = False
+
+    async def _fill(self) -> bool:
+        if self._eof:
+            return False
+        try:
+            chunk = await self._chunks.__anext__()
+        except StopAsyncIteration:
+            self._eof = True
+            return False
+        self._buf = self._buf[self._pos:] + chunk
+        self._pos = 0
+        return True
+
+    async def peek(self) -> int | None:
+        """Return the next non-whitespace byte without consuming it (None at EOF)."""
+        while True:
+            buf = self._buf
+            while self._pos < len(buf) and buf[self._pos] in _WS:
+                self._pos += 1
+            if self._pos < len(buf):
+                return buf[self._pos]
+            if not await self._fill():
+                return None
+
+    async def expect(self, *chars: bytes) -> int:
+        c = await self.peek()
+        if c is None or bytes((c,)) not in chars:
+            raise ValueError(f"Expected one of {chars!r}, got {c!r}")
+        self._pos += 1
+        return c
+
+    async def read_value(self, *, capture: bool) -> bytes | None:
+        """Consume one JSON value; return its raw bytes if capture is set."""
+        c = await self.peek()
+        if c is None:
+            raise ValueError("Unexpected end of JSON stream")
+
+        out = bytearray() if capture else None
+        start = self._pos
+        i = start
+        depth = 0
+        in_string = False
+        escape = False
+        scalar = c not in b"{[\""
+
+        while True:
+            buf = self._buf
+            end = -1
+
+            if scalar:
+                m = _SCALAR_END_RE.search(buf, i)
+                if m:
+                    end = m.start()
+            else:
+                while True:
+                    if escape:
+                        if i >= len(buf):
+                            break
+                        escape = False
+                        i += 1
+                    if in_string:
+                        m = _STRING_RE.search(buf, i)
+                        if not m:
+                            i = len(buf)
+                            break
+                        i = m.end()
+                        if buf[m.start()] == 0x5C:  # backslash
+                            escape = True
+                            continue
+                        in_string = False
+                        if depth == 0:
+                            end = i
+                            break
+                        continue
+                    m = _STRUCT_RE.search(buf, i)
+                    if not m:
+                        i = len(buf)
+                        break
+                    i = m.end()
+                    ch = buf[m.start()]
+                    if ch == 0x22:  # quote
+                        in_string = True
+                    elif ch in b"{[":
+                        depth += 1
+                    else:
+                        depth -= 1
+                        if depth == 0:
+                            end = i
+                            break
+
+            if end >= 0:
+                if out is not None:
+                    out += buf[start:end]
+                self._pos = end
+                return bytes(out) if out is not None else None
+
+            # Need more input: keep what belongs to the captured value, drop the rest.
+            if out is not None:
+                out += buf[start:]
+            self._pos = len(buf)
+            if not await self._fill():
+                if scalar:
+                    return bytes(out) if out is not None else None
+                raise ValueError("Unexpected end of JSON stream")
+            start = 0
+            i = 0
+
+
+async def parse_devices_stream(
+    chunks: AsyncIterator[bytes],
+    fields: dict[str, Iterable[str]],
+) -> dict[str, list[dict[str, Any]]]:
+    """Incrementally parse a /devices response body.
+
+    `fields` maps a top-level list key (e.g. "locks") to the object keys to keep.
+    Each list element is decoded on its own and projected to those keys, so peak
+    memory is proportional to one device rather than the whole payload. Other
+    top-level values are skipped without being buffered.
+    """
+    keep = {k: tuple(v) for k, v in fields.items()}
+    result: dict[str, list[dict[str, Any]]] = {k: [] for k in keep}
+    stream = _JsonStream(chunks)
+
+    if await stream.peek() != ord("{"):
+        return result
+    await stream.expect(b"{")
+    if await stream.peek() == ord("}"):
+        return result
+
+    while True:
+        key = json.loads(await stream.read_value(capture=True))
+        await stream.expect(b":")
+        wanted = keep.get(key)
+
+        if wanted is not None and await stream.peek() == ord("["):
+            await stream.expect(b"[")
+            records = result[key]
+            if await stream.peek() == ord("]"):
+                await stream.expect(b"]")
+            else:
+                while True:
+                    item = json.loads(await stream.read_value(capture=True))
+                    if isinstance(item, dict):
+                        records.append({f: item[f] for f in wanted if f in item})
+                    if await stream.expect(b",", b"]") == ord("]"):
+                        break
+        else:
+            await stream.read_value(capture=False)
+
+        if await stream.expect(b",", b"}") == ord("}"):
+            return result
+
+
+@dataclass
+class InsideTheBoxClient:
+    session: aiohttp.ClientSession
+    token: str
+    base_url: str = API_BASE
+
+    def _headers(self) -> dict[str, str]:
+        # Docs: Authorization: Token <API token>
+        return {"Authorization": f"Token {self.token}"}
+
+    @staticmethod
+    async def _raise_for_status(resp: aiohttp.ClientResponse) -> None:
+        if resp.status in (401, 403, 452):
+            text = await resp.text()
+            raise InsideTheBoxAuthError(f"Auth error {resp.status}: {text}")
+
+        if resp.status == 422:
+            text = await resp.text()
+            raise InsideTheBoxApiError(f"HTTP 422 Unprocessable Entity: {text}")
+
+        if resp.status >= 400:
+            text = await resp.text()
+            raise InsideTheBoxApiError(f"HTTP {resp.status}: {text}")
+
+    async def _request(
+        self,
+        method: str,
+        path: str,
+        *,
+        params: Optional[dict[str, Any]] = None,
+        json_body: Any = None,
+    ) -> Any:
+        url = f"{self.base_url}{path}"
+        try:
+            async with self.session.request(
+                method,
+                url,
+                headers=self._headers(),
+                params=params,
+                json=json_body,
+                ssl=True,
+                timeout=aiohttp.ClientTimeout(total=20),
+            ) as resp:
+                await self._raise_for_status(resp)
+
+                if resp.content_type == "application/json":
+                    return await resp.json()
+
+                return await resp.text()
+
+        except asyncio.TimeoutError as e:
+            raise InsideTheBoxApiError("Timeout calling Inside The Box API") from e
+        except aiohttp.ClientError as e:
+            raise InsideTheBoxApiError(f"Network error: {e}") from e
+
+    async def get_devices(self) -> dict[str, Any]:
+        data = await self._request("GET", "/devices")
+        return data if isinstance(data, dict) else {}
+
+    async def get_device_records(
+        self,
+        *,
+        lock_fields: Iterable[str],
+        gateway_fields: Iterable[str],
+    ) -> dict[str, list[dict[str, Any]]]:
+        """Stream /devices and return only the requested lock and gateway fields."""
+        url = f"{self.base_url}/devices"
+        try:
+            async with self.session.get(
+                url,
+                headers=self._headers(),
+                ssl=True,
+                timeout=aiohttp.ClientTimeout(total=20),
+            ) as resp:
+                await self._raise_for_status(resp)
+
+                if resp.content_type != "application/json":
+                    return {"locks": [], "gateways": []}
+
+                try:
+                    return await parse_devices_stream(
+                        resp.content.iter_chunked(STREAM_CHUNK_SIZE),
+                        {"locks": lock_fields, "gateways": gateway_fields},
+                    )
+                except ValueError as e:
+                    raise InsideTheBoxApiError(f"Malformed /devices response: {e}") from e
+
+        except asyncio.TimeoutError as e:
+            raise InsideTheBoxApiError("Timeout calling Inside The Box API") from e
+        except aiohttp.ClientError as e:
+            raise InsideTheBoxApiError(f"Network error: {e}") from e
+
+    async def open_lock(self, lockid: str, open_duration_seconds: int | None = None) -> None:
+        params = {}
+        if open_duration_seconds is not None:
+            params["openDurationSeconds"] = int(open_duration_seconds)
+        await self._request("GET", f"/lock/open/{lockid}", params=params or None)
+
+    async def close_lock(self, lockid: str) -> None:
+        await self._request("GET", f"/lock/close/{lockid}")
+
+    async def register_webhook_for_lock(
+        self,
+        lockid: str,
+        *,
+        endpoint_host: str,
+        endpoint_port: int,
+        endpoint_path: str,
+        endpoint_querystring: str = "",
+        use_https: bool = True,
+        custom_headers: dict[str, str] | None = None,
+        trigger_webhook: bool = False,
+    ) -> None:
+        params = {"triggerWebhook": "true" if trigger_webhook else "false"}
+        body: dict[str, Any] = {
+            "endpointHost": endpoint_host,
+            "endpointPort": int(endpoint_port),
+            "endpointPath": endpoint_path,
+            "endpointQuerystring": endpoint_querystring or "",
+            "useHttps": bool(use_https),
+        }
+        if custom_headers:
+            body["customHeaders"] = custom_headers
+
+        await self._request("POST", f"/webhook/lock/{lockid}", params=params, json_body=body)
+
+    async def list_webhooks_for_lock(self, lockid: str) -> list[dict[str, Any]]:
+        data = await self._request("GET", f"/webhook/lock/{lockid}")
+        return data if isinstance(data, list) else []
+
+    async def delete_webhook(self, webhookid: str, *, trigger_webhook: bool = False) -> None:
+        params = {"triggerWebhook": "true" if trigger_webhook else "false"}
+        await self._request("DELETE", f"/webhook/{webhookid}", params=params)
\ No newline at end of file
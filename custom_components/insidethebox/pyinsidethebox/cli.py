@@ -0,0 +1,264 @@
+"""Command-line tool for bulk operations against the Inside The Box API.
+
+Part of the Home Assistant-free ``pyinsidethebox`` package; only aiohttp is
+needed. Run it with the integration directory on the path:
+
+    export PYTHONPATH=custom_components/insidethebox
+    python -m pyinsidethebox --token TOKEN devices --format csv
+    python -m pyinsidethebox open LOCKID1 LOCKID2 --duration 10
+    python -m pyinsidethebox webhooks prune --all --host old.example.com --dry-run
+
+The token may also be supplied via the ITB_TOKEN environment variable.
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import csv
+import json
+import os
+import sys
+from typing import Any, Awaitable, Callable, Iterable
+
+import aiohttp
+
+from .api import InsideTheBoxApiError, InsideTheBoxClient
+from .const import API_BASE, GATEWAY_FIELDS, LOCK_FIELDS
+
+DEFAULT_CONCURRENCY = 8
+
+
+class _Progress:
+    """Prints `done/total` progress lines to stderr."""
+
+    def __init__(self, label: str, total: int, enabled: bool) -> None:
+        self._label = label
+        self._total = total
+        self._done = 0
+        self._failed = 0
+        self._enabled = enabled
+
+    def step(self, ok: bool) -> None:
+        self._done += 1
+        if not ok:
+            self._failed += 1
+        if self._enabled:
+            sys.stderr.write(f"\r{self._label}: {self._done}/{self._total} ({self._failed} failed)")
+            if self._done == self._total:
+                sys.stderr.write("\n")
+            sys.stderr.flush()
+
+
+async def _run_bulk(
+    label: str,
+    items: Iterable[str],
+    fn: Callable[[str], Awaitable[Any]],
+    *,
+    concurrency: int,
+    progress: bool,
+) -> dict[str, Any]:
+    """Run fn for every item with at most `concurrency` calls in flight.
+
+    Returns mapping item -> result (or the raised InsideTheBoxApiError).
+    """
+    items = list(items)
+    sem = asyncio.Semaphore(max(1, concurrency))
+    prog = _Progress(label, len(items), progress)
+    results: dict[str, Any] = {}
+
+    async def _one(item: str) -> None:
+        async with sem:
+            try:
+                results[item] = await fn(item)
+            except InsideTheBoxApiError as e:
+                results[item] = e
+                prog.step(False)
+                return
+        prog.step(True)
+
+    await asyncio.gather(*(_one(i) for i in items))
+    return results
+
+
+def _failures(results: dict[str, Any]) -> dict[str, Exception]:
+    return {k: v for k, v in results.items() if isinstance(v, Exception)}
+
+
+def _report_failures(results: dict[str, Any]) -> int:
+    failed = _failures(results)
+    for item, err in failed.items():
+        print(f"{item}: {err}", file=sys.stderr)
+    return 1 if failed else 0
+
+
+async def _lock_ids(client: InsideTheBoxClient, args: argparse.Namespace) -> list[str]:
+    if args.all:
+        devices = await client.get_devices()
+        return [o["lockid"] for o in devices.get("locks") or [] if o.get("lockid")]
+    return list(args.lockids)
+
+
+async def _cmd_devices(client: InsideTheBoxClient, args: argparse.Namespace) -> int:
+    devices = await client.get_devices()
+    locks = devices.get("locks") or []
+    gateways = devices.get("gateways") or []
+
+    if args.format == "json":
+        json.dump({"locks": locks, "gateways": gateways}, sys.stdout, indent=2)
+        sys.stdout.write("\n")
+        return 0
+
+    kind = args.kind
+    rows, columns = (locks, LOCK_FIELDS) if kind == "locks" else (gateways, GATEWAY_FIELDS)
+    writer = csv.DictWriter(sys.stdout, fieldnames=columns, extrasaction="ignore")
+    writer.writeheader()
+    for row in rows:
+        writer.writerow(row)
+    return 0
+
+
+async def _cmd_open(client: InsideTheBoxClient, args: argparse.Namespace) -> int:
+    duration = args.duration
+    if duration is not None:
+        duration = max(0, min(25, duration))
+    lockids = await _lock_ids(client, args)
+    results = await _run_bulk(
+        "open",
+        lockids,
+        lambda lockid: client.open_lock(lockid, open_duration_seconds=duration),
+        concurrency=args.concurrency,
+        progress=not args.quiet,
+    )
+    return _report_failures(results)
+
+
+async def _cmd_close(client: InsideTheBoxClient, args: argparse.Namespace) -> int:
+    lockids = await _lock_ids(client, args)
+    results = await _run_bulk(
+        "close",
+        lockids,
+        client.close_lock,
+        concurrency=args.concurrency,
+        progress=not args.quiet,
+    )
+    return _report_failures(results)
+
+
+def _hook_matches(hook: dict[str, Any], args: argparse.Namespace) -> bool:
+    if args.host and hook.get("endpointHost") != args.host:
+        return False
+    if args.path and hook.get("endpointPath") != args.path:
+        return False
+    return True
+
+
+async def _collect_webhooks(client: InsideTheBoxClient, args: argparse.Namespace) -> tuple[list[dict[str, Any]], int]:
+    lockids = await _lock_ids(client, args)
+    results = await _run_bulk(
+        "list webhooks",
+        lockids,
+        client.list_webhooks_for_lock,
+        concurrency=args.concurrency,
+        progress=not args.quiet,
+    )
+    hooks: list[dict[str, Any]] = []
+    for lockid, value in results.items():
+        if isinstance(value, Exception):
+            continue
+        for hook in value:
+            if _hook_matches(hook, args):
+                hooks.append({"lockid": lockid, **hook})
+    return hooks, _report_failures(results)
+
+
+async def _cmd_webhooks_list(client: InsideTheBoxClient, args: argparse.Namespace) -> int:
+    hooks, rc = await _collect_webhooks(client, args)
+    json.dump(hooks, sys.stdout, indent=2)
+    sys.stdout.write("\n")
+    return rc
+
+
+async def _cmd_webhooks_prune(client: InsideTheBoxClient, args: argparse.Namespace) -> int:
+    hooks, rc = await _collect_webhooks(client, args)
+    webhookids = [h["webhookid"] for h in hooks if h.get("webhookid")]
+
+    if args.dry_run:
+        for h in hooks:
+            print(f"would delete {h.get('webhookid')} (lock {h['lockid']}, host {h.get('endpointHost')})")
+        return rc
+
+    results = await _run_bulk(
+        "delete webhooks",
+        webhookids,
+        lambda webhookid: client.delete_webhook(webhookid, trigger_webhook=False),
+        concurrency=args.concurrency,
+        progress=not args.quiet,
+    )
+    return _report_failures(results) or rc
+
+
+def _add_lock_selection(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument("lockids", nargs="*", default=[], help="Lock ids to operate on")
+    parser.add_argument("--all", action="store_true", help="Operate on every lock on the account")
+
+
+def _build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog="insidethebox", description="Bulk operations for Inside The Box locks.")
+    parser.add_argument("--token", default=os.environ.get("ITB_TOKEN"), help="API token (default: $ITB_TOKEN)")
+    parser.add_argument("--base-url", default=API_BASE)
+    parser.add_argument("--concurrency", type=int, default=DEFAULT_CONCURRENCY, help="Max concurrent API calls")
+    parser.add_argument("-q", "--quiet", action="store_true", help="No progress output on stderr")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    p = sub.add_parser("devices", help="List devices")
+    p.add_argument("--format", choices=["json", "csv"], default="json")
+    p.add_argument("--kind", choices=["locks", "gateways"], default="locks", help="Device kind for CSV output")
+    p.set_defaults(func=_cmd_devices)
+
+    p = sub.add_parser("open", help="Open locks")
+    _add_lock_selection(p)
+    p.add_argument("--duration", type=int, default=None, help="Open duration in seconds (0..25)")
+    p.set_defaults(func=_cmd_open)
+
+    p = sub.add_parser("close", help="Close locks")
+    _add_lock_selection(p)
+    p.set_defaults(func=_cmd_close)
+
+    p = sub.add_parser("webhooks", help="Inspect or prune registered webhooks")
+    wsub = p.add_subparsers(dest="webhooks_command", required=True)
+    for name, func, help_text in (
+        ("list", _cmd_webhooks_list, "List webhooks as JSON"),
+        ("prune", _cmd_webhooks_prune, "Delete matching webhooks"),
+    ):
+        wp = wsub.add_parser(name, help=help_text)
+        _add_lock_selection(wp)
+        wp.add_argument("--host", help="Only webhooks pointing at this endpoint host")
+        wp.add_argument("--path", help="Only webhooks with this endpoint path")
+        if name == "prune":
+            wp.add_argument("--dry-run", action="store_true", help="Only print what would be deleted")
+            wp.add_argument("--force", action="store_true", help="Allow pruning without --host/--path filters")
+        wp.set_defaults(func=func)
+
+    return parser
+
+
+async def _async_main(args: argparse.Namespace) -> int:
+    async with aiohttp.ClientSession() as session:
+        client = InsideTheBoxClient(session, args.token, args.base_url)
+        try:
+            return await args.func(client, args)
+        except InsideTheBoxApiError as e:
+            print(f"error: {e}", file=sys.stderr)
+            return 1
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = _build_parser()
+    args = parser.parse_args(argv)
+    if not args.token:
+        parser.error("an API token is required (--token or ITB_TOKEN)")
+    if hasattr(args, "lockids") and bool(args.lockids) == bool(args.all):
+        parser.error("give either lock ids or --all")
+    if getattr(args, "webhooks_command", None) == "prune" and not (args.host or args.path or args.force):
+        parser.error("prune needs --host and/or --path (or --force to delete every webhook)")
+    return asyncio.run(_async_main(args))
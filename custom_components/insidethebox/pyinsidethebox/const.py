@@ -0,0 +1,22 @@
+API_BASE = "https://api.insidethebox.se/iotapi"
+
+# Device fields kept from /devices; everything else is dropped while streaming
+LOCK_FIELDS = (
+    "lockid",
+    "name",
+    "description",
+    "deviceType",
+    "state",
+    "lockAccessibilityState",
+    "lockBatteryLevel",
+    "isLockOpen",
+    "lastLockOpenOrCloseTimestamp",
+)
+GATEWAY_FIELDS = (
+    "gatewayid",
+    "name",
+    "description",
+    "state",
+    "gatewayConnectionStatus",
+    "gatewayConnectionChangedTimestamp",
+)
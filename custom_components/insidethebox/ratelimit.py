@@ -0,0 +1,47 @@
+from __future__ import annotations
+
+import time
+
+
+class SourceRateLimiter:
+    """Token bucket per source address.
+
+    Each unauthenticated request costs one token; a source with no tokens left
+    is answered with 429 instead of 401. This only classifies and counts
+    repeat offenders: a throttled request costs the same header check as a
+    plain 401. Tokens refill at `refill_per_s` up to `burst`.
+    """
+
+    def __init__(self, burst: int, refill_per_s: float, max_sources: int = 1024) -> None:
+        self._burst = float(burst)
+        self._refill = refill_per_s
+        self._max_sources = max_sources
+        # source -> (tokens, updated), least recently updated first
+        self._buckets: dict[str, tuple[float, float]] = {}
+
+    def _tokens(self, source: str, now: float) -> float:
+        bucket = self._buckets.get(source)
+        if bucket is None:
+            return self._burst
+        tokens, updated = bucket
+        return min(self._burst, tokens + (now - updated) * self._refill)
+
+    def is_blocked(self, source: str) -> bool:
+        if source not in self._buckets:
+            return False
+        return self._tokens(source, time.monotonic()) < 1.0
+
+    def penalize(self, source: str) -> None:
+        now = time.monotonic()
+        tokens = self._tokens(source, now) - 1.0
+        # Re-insert so dict order stays least-recently-updated first
+        if self._buckets.pop(source, None) is None and len(self._buckets) >= self._max_sources:
+            self._prune(now)
+        self._buckets[source] = (max(tokens, 0.0), now)
+
+    def _prune(self, now: float) -> None:
+        # Drop fully refilled buckets; if all are still draining, drop the least recently updated
+        for source in [s for s in self._buckets if self._tokens(s, now) >= self._burst]:
+            del self._buckets[source]
+        while len(self._buckets) >= self._max_sources:
+            del self._buckets[next(iter(self._buckets))]
@@ -1,104 +1,70 @@
 from __future__ import annotations
 
 import logging
-from dataclasses import dataclass
-from typing import Any, Callable
+from typing import Any
 
-from homeassistant.components.sensor import SensorEntity, SensorEntityDescription
+from homeassistant.components.sensor import SensorEntity
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
-from .const import DOMAIN
+from .analytics import InsideTheBoxAnalytics
+from .const import CONF_GATEWAY_SENSORS, CONF_LOCK_SENSORS, DOMAIN
 from .coordinator import InsideTheBoxCoordinator
+from .descriptions import (
+    GATEWAY_SENSORS,
+    ITBAnalyticsSensorEntityDescription,
+    ITBSensorEntityDescription,
+    LOCK_ANALYTICS_SENSORS,
+    LOCK_SENSORS,
+)
+from .entity import async_remove_entities, split_descriptions
+from .profiler import profiled
 
 _LOGGER = logging.getLogger(__name__)
 
 
-@dataclass(frozen=True, kw_only=True)
-class ITBSensorEntityDescription(SensorEntityDescription):
-    value_fn: Callable[[dict[str, Any]], Any]
-
-
-LOCK_SENSORS: list[ITBSensorEntityDescription] = [
-    ITBSensorEntityDescription(
-        key="lockBatteryLevel",
-        name="Battery level",
-        icon="mdi:battery",
-        native_unit_of_measurement="%",
-        value_fn=lambda o: int(o["lockBatteryLevel"]) if o.get("lockBatteryLevel") is not None else None,
-    ),
-    ITBSensorEntityDescription(
-        key="lockAccessibilityState",
-        name="Accessibility state",
-        icon="mdi:shield-lock",
-        value_fn=lambda o: o.get("lockAccessibilityState"),
-    ),
-    ITBSensorEntityDescription(
-        key="state",
-        name="State",
-        icon="mdi:information-outline",
-        value_fn=lambda o: o.get("state"),
-    ),
-    ITBSensorEntityDescription(
-        key="lastLockOpenOrCloseTimestamp",
-        name="Last open/close",
-        icon="mdi:clock-outline",
-        value_fn=lambda o: o.get("lastLockOpenOrCloseTimestamp"),
-    ),
-]
-
-GATEWAY_SENSORS: list[ITBSensorEntityDescription] = [
-    ITBSensorEntityDescription(
-        key="gatewayConnectionStatus",
-        name="Connection",
-        icon="mdi:lan-connect",
-        value_fn=lambda o: o.get("gatewayConnectionStatus"),
-    ),
-    ITBSensorEntityDescription(
-        key="gatewayConnectionChangedTimestamp",
-        name="Connection changed",
-        icon="mdi:clock-outline",
-        value_fn=lambda o: o.get("gatewayConnectionChangedTimestamp"),
-    ),
-    ITBSensorEntityDescription(
-        key="state",
-        name="State",
-        icon="mdi:information-outline",
-        value_fn=lambda o: o.get("state"),
-    ),
-]
-
-
 import logging
 _LOGGER = logging.getLogger(__name__)
 
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry, async_add_entities) -> None:
     ctx = hass.data[DOMAIN][entry.entry_id]
     coordinator: InsideTheBoxCoordinator = ctx["coordinator"]
+    analytics: InsideTheBoxAnalytics = ctx["analytics"]
 
     locks = (coordinator.data or {}).get("locks") or []
     gateways = (coordinator.data or {}).get("gateways") or []
 
     _LOGGER.warning("ITB sensor setup: %s locks, %s gateways", len(locks), len(gateways))
 
+    lock_sensors, lock_dropped = split_descriptions(entry, CONF_LOCK_SENSORS, LOCK_SENSORS)
+    analytics_sensors, analytics_dropped = split_descriptions(entry, CONF_LOCK_SENSORS, LOCK_ANALYTICS_SENSORS)
+    gateway_sensors, gateway_dropped = split_descriptions(entry, CONF_GATEWAY_SENSORS, GATEWAY_SENSORS)
+
     entities: list[SensorEntity] = []
+    dropped_ids: list[str] = []
 
     for lock_obj in locks:
         lockid = lock_obj.get("lockid")
         if not lockid:
             continue
         name = lock_obj.get("name") or lock_obj.get("description") or lockid
-        for desc in LOCK_SENSORS:
+        for desc in lock_sensors:
             entities.append(InsideTheBoxLockSensor(coordinator, lockid, name, desc))
+        for desc in analytics_sensors:
+            entities.append(InsideTheBoxLockAnalyticsSensor(coordinator, analytics, lockid, name, desc))
+        dropped_ids.extend(f"insidethebox_lock_{lockid}_{d.key}" for d in lock_dropped + analytics_dropped)
 
     for gw_obj in gateways:
         gid = gw_obj.get("gatewayid")
         if not gid:
             continue
         name = gw_obj.get("name") or gw_obj.get("description") or gid
-        for desc in GATEWAY_SENSORS:
+        for desc in gateway_sensors:
             entities.append(InsideTheBoxGatewaySensor(coordinator, gid, name, desc))
+        dropped_ids.extend(f"insidethebox_gateway_{gid}_{d.key}" for d in gateway_dropped)
+
+    async_remove_entities(hass, "sensor", dropped_ids)
 
     _LOGGER.warning("ITB sensor setup: adding %s sensor entities", len(entities))
     async_add_entities(entities)
@@ -114,6 +80,7 @@ class _Base(CoordinatorEntity[InsideTheBoxCoordinator], SensorEntity):
         self._device_name = device_name
 
     @property
+    @profiled
     def native_value(self):
         obj = self._find_obj() or {}
         return self.entity_description.value_fn(obj)
@@ -154,4 +121,27 @@ class InsideTheBoxGatewaySensor(_Base):
         for o in (self.coordinator.data or {}).get("gateways", []):
             if o.get("gatewayid") == self._device_id:
                 return o
-        return None
\ No newline at end of file
+        return None
+
+
+class InsideTheBoxLockAnalyticsSensor(InsideTheBoxLockSensor):
+    entity_description: ITBAnalyticsSensorEntityDescription
+
+    def __init__(
+        self,
+        coordinator,
+        analytics: InsideTheBoxAnalytics,
+        lockid: str,
+        lock_name: str,
+        desc: ITBAnalyticsSensorEntityDescription,
+    ):
+        super().__init__(coordinator, lockid, lock_name, desc)
+        self._analytics = analytics
+
+    @property
+    @profiled
+    def native_value(self):
+        usage = self._analytics.get(self._device_id)
+        if usage is None:
+            return None
+        return self.entity_description.value_fn(usage)
\ No newline at end of file
@@ -0,0 +1,156 @@
+from __future__ import annotations
+
+from dataclasses import dataclass, fields
+from datetime import date, datetime, timezone
+from typing import Any
+
+from .const import ANALYTICS_EMA_ALPHA, BATTERY_REPLACED_JUMP
+
+# Ignore depletion estimates further out than this (flat trend)
+_MAX_DEPLETION_DAYS = 10 * 365
+
+
+def _parse_ts(value: Any) -> datetime | None:
+    """Parse an API timestamp (ISO string or epoch seconds/milliseconds)."""
+    if value is None:
+        return None
+    if isinstance(value, (int, float)):
+        seconds = value / 1000 if value > 1e11 else value
+        return datetime.fromtimestamp(seconds, timezone.utc)
+    if isinstance(value, str):
+        try:
+            parsed = datetime.fromisoformat(value)
+        except ValueError:
+            return None
+        if parsed.tzinfo is None:
+            parsed = parsed.replace(tzinfo=timezone.utc)
+        return parsed
+    return None
+
+
+@dataclass
+class LockUsage:
+    """Running usage/battery state for one lock, updated in O(1) per observation."""
+
+    last_event: str | None = None  # last seen lastLockOpenOrCloseTimestamp
+    last_open: bool | None = None
+    open_since: float | None = None  # epoch seconds
+
+    day: str | None = None  # local date the counter belongs to
+    opens_day: int = 0
+    mean_open_duration: float | None = None  # EMA, seconds
+
+    # Least squares of battery level against days since battery_t0
+    battery_level: float | None = None
+    battery_t0: float | None = None
+    n: int = 0
+    sum_t: float = 0.0
+    sum_y: float = 0.0
+    sum_tt: float = 0.0
+    sum_ty: float = 0.0
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> LockUsage:
+        names = {f.name for f in fields(cls)}
+        return cls(**{k: v for k, v in data.items() if k in names})
+
+    def opens_on(self, day: date) -> int:
+        return self.opens_day if self.day == day.isoformat() else 0
+
+    def battery_depletion(self) -> datetime | None:
+        if self.n < 2 or self.battery_t0 is None:
+            return None
+        denom = self.n * self.sum_tt - self.sum_t * self.sum_t
+        if denom <= 0:
+            return None
+        slope = (self.n * self.sum_ty - self.sum_t * self.sum_y) / denom
+        if slope >= 0:
+            return None
+        intercept = (self.sum_y - slope * self.sum_t) / self.n
+        t_zero = -intercept / slope
+        if t_zero > _MAX_DEPLETION_DAYS:
+            return None
+        return datetime.fromtimestamp(self.battery_t0 + t_zero * 86400, timezone.utc)
+
+    def observe(self, obj: dict[str, Any], now: datetime) -> bool:
+        """Feed one lock record; returns True if the running state changed.
+
+        `now` must be timezone-aware in local time; its zone decides which day
+        an open is counted on.
+        """
+        changed = self._observe_open_close(obj, now)
+        return self._observe_battery(obj, now) or changed
+
+    def _observe_open_close(self, obj: dict[str, Any], now: datetime) -> bool:
+        is_open = obj.get("isLockOpen")
+        if is_open is None:
+            return False
+        is_open = bool(is_open)
+        raw_ts = obj.get("lastLockOpenOrCloseTimestamp")
+        event = str(raw_ts) if raw_ts is not None else None
+
+        if self.last_open is None:
+            # First sighting: baseline only
+            self.last_open = is_open
+            self.last_event = event
+            if is_open:
+                self.open_since = (_parse_ts(raw_ts) or now).timestamp()
+            return True
+
+        if event == self.last_event and is_open == self.last_open:
+            return False
+
+        at = _parse_ts(raw_ts) or now
+        if is_open:
+            self._count_open(at.astimezone(now.tzinfo))
+            self.open_since = at.timestamp()
+        else:
+            if self.open_since is not None:
+                duration = at.timestamp() - self.open_since
+                if duration >= 0:
+                    if self.mean_open_duration is None:
+                        self.mean_open_duration = duration
+                    else:
+                        self.mean_open_duration += ANALYTICS_EMA_ALPHA * (duration - self.mean_open_duration)
+            elif event != self.last_event:
+                # Opened and closed again between two observations
+                self._count_open(at.astimezone(now.tzinfo))
+            self.open_since = None
+
+        self.last_open = is_open
+        self.last_event = event
+        return True
+
+    def _count_open(self, at: datetime) -> None:
+        day = at.date().isoformat()
+        if day != self.day:
+            self.day = day
+            self.opens_day = 0
+        self.opens_day += 1
+
+    def _observe_battery(self, obj: dict[str, Any], now: datetime) -> bool:
+        level = obj.get("lockBatteryLevel")
+        if level is None:
+            return False
+        try:
+            level = float(level)
+        except (TypeError, ValueError):
+            return False
+
+        if self.battery_level is not None and level == self.battery_level and self.n:
+            return False
+
+        if self.battery_level is None or level >= self.battery_level + BATTERY_REPLACED_JUMP:
+            # First sample or battery replaced: start a new regression
+            self.battery_t0 = now.timestamp()
+            self.n = 0
+            self.sum_t = self.sum_y = self.sum_tt = self.sum_ty = 0.0
+
+        t = (now.timestamp() - self.battery_t0) / 86400
+        self.n += 1
+        self.sum_t += t
+        self.sum_y += level
+        self.sum_tt += t * t
+        self.sum_ty += t * level
+        self.battery_level = level
+        return True
@@ -0,0 +1,158 @@
+from __future__ import annotations
+
+import hmac
+import json
+import logging
+from typing import Any
+
+from aiohttp import web
+
+from .const import (
+    EVENT_GATEWAY_CONNECTION_CHANGED,
+    EVENT_GATEWAY_UPDATED,
+    EVENT_LOCK_CLOSED,
+    EVENT_LOCK_OPENED,
+    EVENT_LOCK_UPDATED,
+    GATEWAY_FIELDS,
+    LOCK_FIELDS,
+    WEBHOOK_HEADER_NAME,
+    WEBHOOK_MAX_BODY_BYTES,
+)
+from .ratelimit import SourceRateLimiter
+
+_LOGGER = logging.getLogger(__name__)
+
+
+async def read_body(request: web.Request, limit: int) -> bytes | None:
+    """Read the request body, or return None as soon as it exceeds limit bytes."""
+    if request.content_length is not None and request.content_length > limit:
+        return None
+    body = bytearray()
+    async for chunk in request.content.iter_chunked(8192):
+        body += chunk
+        if len(body) > limit:
+            return None
+    return bytes(body)
+
+
+async def async_check_request(
+    request: web.Request,
+    secret: str,
+    limiter: SourceRateLimiter,
+    stats: dict[str, int],
+) -> dict[str, Any] | web.Response:
+    """Authenticate and decode a webhook request.
+
+    Returns the JSON object payload, or the error response to send. Every
+    outcome bumps its counter in stats.
+    """
+    source = request.remote or "unknown"
+
+    def _reject(reason: str, status: int, text: str) -> web.Response:
+        stats[reason] += 1
+        _LOGGER.debug("Rejected webhook from %s: %s", source, reason)
+        return web.Response(status=status, text=text)
+
+    # Header-only check first: correctly signed pushes never touch the limiter,
+    # so junk traffic sharing a source (reverse proxy) cannot lock them out.
+    got = request.headers.get(WEBHOOK_HEADER_NAME, "")
+    if not got or not hmac.compare_digest(got.encode(), secret.encode()):
+        if limiter.is_blocked(source):
+            return _reject("rate_limited", 429, "too many requests")
+        limiter.penalize(source)
+        return _reject("unauthorized", 401, "unauthorized")
+
+    body = await read_body(request, WEBHOOK_MAX_BODY_BYTES)
+    if body is None:
+        return _reject("too_large", 413, "payload too large")
+
+    try:
+        payload = json.loads(body)
+    except ValueError:
+        return _reject("invalid_json", 400, "invalid json")
+    if not isinstance(payload, dict):
+        return _reject("invalid_json", 400, "invalid json")
+
+    stats["accepted"] += 1
+    return payload
+
+
+def extract_devices(payload: dict[str, Any]) -> tuple[dict[str, Any] | None, dict[str, Any] | None]:
+    """Return (lock, gateway) objects found in a webhook payload, projected to the fields entities use.
+
+    Only per-lock webhooks can be registered with the API, so the only gateway
+    source is a `webhookDevice` that carries a gatewayid and no lockid.
+    """
+    lock_obj = None
+    gateway_obj = None
+
+    for key in ("deliveryLock", "lock", "webhookDevice"):
+        obj = payload.get(key)
+        if isinstance(obj, dict) and obj.get("lockid"):
+            lock_obj = {k: obj[k] for k in LOCK_FIELDS if k in obj}
+            break
+
+    obj = payload.get("webhookDevice")
+    if isinstance(obj, dict) and obj.get("gatewayid") and not obj.get("lockid"):
+        gateway_obj = {k: obj[k] for k in GATEWAY_FIELDS if k in obj}
+
+    return lock_obj, gateway_obj
+
+
+def find_device(data: dict[str, Any], kind: str, id_key: str, device_id: str) -> dict[str, Any]:
+    """Return the current record for device_id in data[kind] ({} if unknown)."""
+    for obj in data.get(kind, []):
+        if obj.get(id_key) == device_id:
+            return obj
+    return {}
+
+
+def merge_device(data: dict[str, Any], kind: str, id_key: str, obj: dict[str, Any]) -> dict[str, Any]:
+    """Return a copy of coordinator data with obj merged into data[kind]."""
+    items = list(data.get(kind, []))
+    for i, existing in enumerate(items):
+        if existing.get(id_key) == obj[id_key]:
+            items[i] = {**existing, **obj}
+            break
+    else:
+        items.append(obj)
+    return {**data, kind: items}
+
+
+def _as_bool(value: Any) -> bool | None:
+    return None if value is None else bool(value)
+
+
+def apply_payload(
+    data: dict[str, Any], payload: dict[str, Any]
+) -> tuple[dict[str, Any], list[tuple[str, dict[str, Any]]]]:
+    """Merge a webhook payload into coordinator data.
+
+    Returns the new data and the typed events to fire as (event_type, device fields).
+    opened/closed and connection_changed are only chosen when the value differs
+    from the stored record; everything else is an *_updated event.
+    """
+    lock_obj, gateway_obj = extract_devices(payload)
+    events: list[tuple[str, dict[str, Any]]] = []
+
+    if lock_obj is not None:
+        previous = find_device(data, "locks", "lockid", lock_obj["lockid"])
+        data = merge_device(data, "locks", "lockid", lock_obj)
+        is_open = lock_obj.get("isLockOpen")
+        if is_open is not None and bool(is_open) != _as_bool(previous.get("isLockOpen")):
+            event = EVENT_LOCK_OPENED if is_open else EVENT_LOCK_CLOSED
+        else:
+            event = EVENT_LOCK_UPDATED
+        events.append((event, lock_obj))
+
+    if gateway_obj is not None:
+        previous = find_device(data, "gateways", "gatewayid", gateway_obj["gatewayid"])
+        data = merge_device(data, "gateways", "gatewayid", gateway_obj)
+        status = gateway_obj.get("gatewayConnectionStatus")
+        if status is not None and status != previous.get("gatewayConnectionStatus"):
+            event = EVENT_GATEWAY_CONNECTION_CHANGED
+        else:
+            event = EVENT_GATEWAY_UPDATED
+        events.append((event, gateway_obj))
+
+    return data, events
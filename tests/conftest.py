@@ -0,0 +1,29 @@
+"""Make the Home Assistant-free parts of the integration importable in tests.
+
+- ``pyinsidethebox`` is imported as a top-level package, as standalone users do.
+- ``integration_module(name)`` imports ``custom_components.insidethebox.<name>``
+  without running the integration's ``__init__.py`` (which needs Home Assistant),
+  so HA-free modules with relative imports can be tested directly.
+"""
+from __future__ import annotations
+
+import importlib
+import sys
+import types
+from pathlib import Path
+
+INTEGRATION_DIR = Path(__file__).resolve().parents[1] / "custom_components" / "insidethebox"
+
+sys.path.insert(0, str(INTEGRATION_DIR))
+
+
+def integration_module(name: str) -> types.ModuleType:
+    for pkg, path in (
+        ("custom_components", INTEGRATION_DIR.parent),
+        ("custom_components.insidethebox", INTEGRATION_DIR),
+    ):
+        if pkg not in sys.modules:
+            module = types.ModuleType(pkg)
+            module.__path__ = [str(path)]
+            sys.modules[pkg] = module
+    return importlib.import_module(f"custom_components.insidethebox.{name}")
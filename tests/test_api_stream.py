@@ -0,0 +1,118 @@
+"""Tests for the streaming /devices parser in pyinsidethebox.api."""
+from __future__ import annotations
+
+import asyncio
+import json
+
+import pytest
+
+pytest.importorskip("aiohttp")
+
+from pyinsidethebox import api  # noqa: E402
+
+FIELDS = {"locks": ("lockid", "name", "isLockOpen"), "gateways": ("gatewayid", "gatewayConnectionStatus")}
+
+DOC = {
+    "account": {"note": 'quote " bracket ] brace } backslash \\ end', "list": [1, [2, {"x": None}]]},
+    "locks": [
+        {"lockid": "L1", "name": 'Box "A" \\ [1]', "isLockOpen": False, "extra": {"deep": ["}", "{"]}},
+        {"lockid": "L2", "name": "Låda B", "isLockOpen": True, "lockBatteryLevel": 87},
+        "not-an-object",
+    ],
+    "gateways": [{"gatewayid": "G1", "gatewayConnectionStatus": "ONLINE", "unused": 1.5e3}],
+    "trailing": True,
+}
+
+
+async def _chunks(body: bytes, size: int):
+    for i in range(0, len(body), size):
+        yield body[i:i + size]
+
+
+def _parse(body: bytes, size: int) -> dict:
+    return asyncio.run(api.parse_devices_stream(_chunks(body, size), FIELDS))
+
+
+def _expected(doc: dict) -> dict:
+    return {
+        key: [{f: o[f] for f in fields if f in o} for o in doc.get(key) or [] if isinstance(o, dict)]
+        for key, fields in FIELDS.items()
+    }
+
+
+@pytest.mark.parametrize("indent", [None, 2])
+@pytest.mark.parametrize("ensure_ascii", [True, False])
+def test_every_chunk_boundary(indent, ensure_ascii):
+    body = json.dumps(DOC, indent=indent, ensure_ascii=ensure_ascii).encode()
+    expected = _expected(DOC)
+    # Size 1 splits inside every string, escape sequence and multi-byte character
+    for size in list(range(1, 40)) + [len(body)]:
+        assert _parse(body, size) == expected, size
+
+
+def test_null_and_missing_lists():
+    assert _parse(b'{"locks": null, "other": [1, 2]}', 3) == {"locks": [], "gateways": []}
+    assert _parse(b"{}", 1) == {"locks": [], "gateways": []}
+    assert _parse(b' { "locks" : [ ] , "gateways" : [ ] } ', 2) == {"locks": [], "gateways": []}
+
+
+def test_non_object_body():
+    assert _parse(b"[]", 1) == {"locks": [], "gateways": []}
+
+
+class _FakeContent:
+    def __init__(self, body: bytes, size: int) -> None:
+        self._body = body
+        self._size = size
+
+    def iter_chunked(self, _n: int):
+        return _chunks(self._body, self._size)
+
+
+class _FakeResponse:
+    status = 200
+    content_type = "application/json"
+
+    def __init__(self, body: bytes) -> None:
+        self.content = _FakeContent(body, 5)
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+
+class _FakeSession:
+    def __init__(self, body: bytes) -> None:
+        self._body = body
+
+    def get(self, *args, **kwargs):
+        return _FakeResponse(self._body)
+
+
+def _records(body: bytes) -> dict:
+    client = api.InsideTheBoxClient(_FakeSession(body), "token")
+    return asyncio.run(
+        client.get_device_records(lock_fields=FIELDS["locks"], gateway_fields=FIELDS["gateways"])
+    )
+
+
+def test_get_device_records():
+    body = json.dumps(DOC).encode()
+    assert _records(body) == _expected(DOC)
+
+
+@pytest.mark.parametrize(
+    "body",
+    [
+        b'{"locks": [{"lockid": "L1"}',
+        b'{"locks": [{"lockid": "L1", "name": "trunc',
+        b'{"locks": [{"lockid": "L1", "name": "esc\\',
+        b'{"locks": [{"lockid": }]}',
+        b'{"locks": [] "gateways": []}',
+    ],
+)
+def test_malformed_body_raises_api_error(body):
+    with pytest.raises(api.InsideTheBoxApiError):
+        _records(body)
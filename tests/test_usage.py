@@ -0,0 +1,124 @@
+"""Tests for the incremental per-lock usage and battery statistics."""
+from __future__ import annotations
+
+from dataclasses import asdict
+from datetime import datetime, timedelta, timezone
+
+from conftest import integration_module
+
+usage_mod = integration_module("usage")
+const = integration_module("const")
+LockUsage = usage_mod.LockUsage
+
+TZ = timezone(timedelta(hours=2))
+T0 = datetime(2026, 3, 10, 8, 0, tzinfo=TZ)
+
+
+def _lock(is_open: bool, at: datetime, battery: float | None = None) -> dict:
+    obj = {"isLockOpen": is_open, "lastLockOpenOrCloseTimestamp": at.isoformat()}
+    if battery is not None:
+        obj["lockBatteryLevel"] = battery
+    return obj
+
+
+def test_first_sighting_is_baseline_only():
+    u = LockUsage()
+    assert u.observe(_lock(False, T0), T0) is True
+    assert u.opens_on(T0.date()) == 0
+    assert u.mean_open_duration is None
+    assert u.last_open is False
+
+
+def test_unchanged_poll_returns_false():
+    u = LockUsage()
+    u.observe(_lock(False, T0, 80), T0)
+    assert u.observe(_lock(False, T0, 80), T0 + timedelta(minutes=5)) is False
+
+
+def test_open_then_close_updates_ema():
+    u = LockUsage()
+    u.observe(_lock(False, T0), T0)
+    u.observe(_lock(True, T0 + timedelta(minutes=1)), T0 + timedelta(minutes=1))
+    u.observe(_lock(False, T0 + timedelta(minutes=1, seconds=20)), T0 + timedelta(minutes=2))
+    assert u.opens_on(T0.date()) == 1
+    assert u.mean_open_duration == 20
+
+    u.observe(_lock(True, T0 + timedelta(hours=1)), T0 + timedelta(hours=1))
+    u.observe(_lock(False, T0 + timedelta(hours=1, seconds=30)), T0 + timedelta(hours=1, minutes=1))
+    assert u.opens_on(T0.date()) == 2
+    assert u.mean_open_duration == 20 + const.ANALYTICS_EMA_ALPHA * (30 - 20)
+
+
+def test_new_close_timestamp_without_seen_open_counts_one_open():
+    u = LockUsage()
+    u.observe(_lock(False, T0), T0)
+    u.observe(_lock(False, T0 + timedelta(minutes=3)), T0 + timedelta(minutes=5))
+    assert u.opens_on(T0.date()) == 1
+    assert u.mean_open_duration is None
+
+
+def test_day_rollover_resets_counter():
+    u = LockUsage()
+    u.observe(_lock(False, T0), T0)
+    u.observe(_lock(True, T0 + timedelta(minutes=1)), T0 + timedelta(minutes=1))
+    next_day = T0 + timedelta(days=1)
+    u.observe(_lock(False, next_day), next_day)
+    u.observe(_lock(True, next_day + timedelta(minutes=1)), next_day + timedelta(minutes=1))
+    assert u.opens_on(T0.date()) == 0
+    assert u.opens_on(next_day.date()) == 1
+
+
+def test_day_uses_local_zone_of_now():
+    u = LockUsage()
+    u.observe(_lock(False, T0), T0)
+    # 23:30 UTC on the 10th is 01:30 on the 11th in UTC+2
+    at = datetime(2026, 3, 10, 23, 30, tzinfo=timezone.utc)
+    u.observe(_lock(True, at), at.astimezone(TZ))
+    assert u.day == "2026-03-11"
+
+
+def test_battery_linear_depletion_date():
+    u = LockUsage()
+    for day in range(10):
+        u.observe({"lockBatteryLevel": 100 - 2 * day}, T0 + timedelta(days=day))
+    depleted = u.battery_depletion()
+    assert depleted is not None
+    assert abs(depleted - (T0 + timedelta(days=50))) < timedelta(minutes=1)
+
+
+def test_flat_or_rising_battery_has_no_estimate():
+    u = LockUsage()
+    u.observe({"lockBatteryLevel": 80}, T0)
+    assert u.battery_depletion() is None  # single sample
+    u.observe({"lockBatteryLevel": 80}, T0 + timedelta(days=5))
+    assert u.battery_depletion() is None  # unchanged level adds no sample
+
+    rising = LockUsage()
+    rising.observe({"lockBatteryLevel": 50}, T0)
+    rising.observe({"lockBatteryLevel": 55}, T0 + timedelta(days=1))
+    assert rising.battery_depletion() is None
+
+
+def test_battery_swap_restarts_regression():
+    u = LockUsage()
+    for day in range(5):
+        u.observe({"lockBatteryLevel": 30 - 5 * day}, T0 + timedelta(days=day))
+    swap = T0 + timedelta(days=6)
+    u.observe({"lockBatteryLevel": 10 + const.BATTERY_REPLACED_JUMP}, swap)
+    assert u.n == 1
+    assert u.battery_t0 == swap.timestamp()
+    assert u.battery_depletion() is None
+
+    # A smaller rise is noise, not a swap
+    v = LockUsage()
+    v.observe({"lockBatteryLevel": 50}, T0)
+    v.observe({"lockBatteryLevel": 50 + const.BATTERY_REPLACED_JUMP - 1}, T0 + timedelta(days=1))
+    assert v.n == 2
+
+
+def test_round_trip():
+    u = LockUsage()
+    u.observe(_lock(False, T0, 90), T0)
+    u.observe(_lock(True, T0 + timedelta(minutes=1), 89), T0 + timedelta(days=1))
+    restored = LockUsage.from_dict({**asdict(u), "unknown_future_field": 1})
+    assert restored == u
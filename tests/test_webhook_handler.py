@@ -0,0 +1,64 @@
+"""Tests for merging webhook payloads and choosing the typed events."""
+from __future__ import annotations
+
+from conftest import integration_module
+
+wh = integration_module("webhook_handler")
+const = integration_module("const")
+
+DATA = {
+    "locks": [{"lockid": "L1", "isLockOpen": False, "lockBatteryLevel": 90}],
+    "gateways": [{"gatewayid": "G1", "gatewayConnectionStatus": "ONLINE"}],
+}
+
+
+def _events(payload, data=DATA):
+    return [event for event, _ in wh.apply_payload(data, payload)[1]]
+
+
+def test_lock_open_state_change():
+    assert _events({"lock": {"lockid": "L1", "isLockOpen": True}}) == [const.EVENT_LOCK_OPENED]
+    opened = {**DATA, "locks": [{"lockid": "L1", "isLockOpen": True}]}
+    assert _events({"lock": {"lockid": "L1", "isLockOpen": False}}, opened) == [const.EVENT_LOCK_CLOSED]
+
+
+def test_lock_unchanged_open_state_is_update():
+    assert _events({"deliveryLock": {"lockid": "L1", "isLockOpen": False, "lockBatteryLevel": 80}}) == [
+        const.EVENT_LOCK_UPDATED
+    ]
+    assert _events({"lock": {"lockid": "L1", "lockBatteryLevel": 80}}) == [const.EVENT_LOCK_UPDATED]
+
+
+def test_unknown_lock_with_open_state_counts_as_change():
+    assert _events({"lock": {"lockid": "L9", "isLockOpen": False}}) == [const.EVENT_LOCK_CLOSED]
+
+
+def test_lock_merge_projects_fields():
+    data, events = wh.apply_payload(DATA, {"lock": {"lockid": "L1", "isLockOpen": True, "junk": "x"}})
+    assert data["locks"] == [{"lockid": "L1", "isLockOpen": True, "lockBatteryLevel": 90}]
+    assert events == [(const.EVENT_LOCK_OPENED, {"lockid": "L1", "isLockOpen": True})]
+    # Input is not mutated
+    assert DATA["locks"][0]["isLockOpen"] is False
+
+
+def test_gateway_connection_change():
+    offline = {"webhookDevice": {"gatewayid": "G1", "gatewayConnectionStatus": "OFFLINE"}}
+    data, events = wh.apply_payload(DATA, offline)
+    assert [e for e, _ in events] == [const.EVENT_GATEWAY_CONNECTION_CHANGED]
+    assert data["gateways"] == [{"gatewayid": "G1", "gatewayConnectionStatus": "OFFLINE"}]
+
+    same = {"webhookDevice": {"gatewayid": "G1", "gatewayConnectionStatus": "ONLINE", "state": "ACTIVE"}}
+    assert _events(same) == [const.EVENT_GATEWAY_UPDATED]
+
+
+def test_webhook_device_with_lockid_is_lock_only():
+    payload = {"webhookDevice": {"lockid": "L1", "gatewayid": "G1", "isLockOpen": True}}
+    data, events = wh.apply_payload(DATA, payload)
+    assert [e for e, _ in events] == [const.EVENT_LOCK_OPENED]
+    assert data["gateways"] == DATA["gateways"]
+
+
+def test_unrecognized_payload_has_no_events():
+    data, events = wh.apply_payload(DATA, {"gateway": {"gatewayid": "G1"}, "lock": {"name": "no id"}})
+    assert events == []
+    assert data == DATA
@@ -0,0 +1,115 @@
+"""Tests for webhook request authentication, size limits and rate limiting."""
+from __future__ import annotations
+
+import asyncio
+import json
+from unittest import mock
+
+import pytest
+
+pytest.importorskip("aiohttp")
+
+from aiohttp import streams, web  # noqa: E402
+from aiohttp.test_utils import make_mocked_request  # noqa: E402
+
+from conftest import integration_module  # noqa: E402
+
+wh = integration_module("webhook_handler")
+const = integration_module("const")
+ratelimit = integration_module("ratelimit")
+
+SECRET = "s3cret"
+SIGNED = {const.WEBHOOK_HEADER_NAME: SECRET}
+
+
+def _stats() -> dict[str, int]:
+    return dict.fromkeys(("accepted", "unauthorized", "too_large", "invalid_json", "rate_limited"), 0)
+
+
+def _limiter():
+    return ratelimit.SourceRateLimiter(const.WEBHOOK_RATE_BURST, const.WEBHOOK_RATE_REFILL_PER_S)
+
+
+async def _check(body: bytes, headers: dict[str, str], limiter, stats, *, content_length: bool = True, remote="203.0.113.7"):
+    reader = streams.StreamReader(mock.Mock(_reading_paused=False), 2**16, loop=asyncio.get_running_loop())
+    reader.feed_data(body)
+    reader.feed_eof()
+    headers = dict(headers)
+    if content_length:
+        headers["Content-Length"] = str(len(body))
+    request = make_mocked_request("POST", "/api/webhook/abc", headers=headers, payload=reader).clone(remote=remote)
+    return await wh.async_check_request(request, SECRET, limiter, stats)
+
+
+def _status(result) -> int:
+    return result.status if isinstance(result, web.Response) else 200
+
+
+def test_valid_request():
+    stats = _stats()
+    result = asyncio.run(_check(b'{"lock": {"lockid": "L1"}}', SIGNED, _limiter(), stats))
+    assert result == {"lock": {"lockid": "L1"}}
+    assert stats["accepted"] == 1
+
+
+@pytest.mark.parametrize("headers", [{}, {const.WEBHOOK_HEADER_NAME: ""}, {const.WEBHOOK_HEADER_NAME: "wrong"}])
+def test_bad_secret_is_401(headers):
+    stats = _stats()
+    assert _status(asyncio.run(_check(b"{}", headers, _limiter(), stats))) == 401
+    assert stats["unauthorized"] == 1
+
+
+def test_repeated_bad_secret_is_429_but_signed_still_passes():
+    async def run():
+        limiter, stats = _limiter(), _stats()
+        for _ in range(const.WEBHOOK_RATE_BURST):
+            assert _status(await _check(b"{}", {}, limiter, stats)) == 401
+        assert _status(await _check(b"{}", {}, limiter, stats)) == 429
+        # Same (shared proxy) source, correctly signed: never throttled
+        assert _status(await _check(b"{}", SIGNED, limiter, stats)) == 200
+        # Other sources are unaffected
+        assert _status(await _check(b"{}", {}, limiter, stats, remote="198.51.100.1")) == 401
+        return stats
+
+    stats = asyncio.run(run())
+    assert stats["unauthorized"] == const.WEBHOOK_RATE_BURST + 1
+    assert stats["rate_limited"] == 1
+    assert stats["accepted"] == 1
+
+
+def test_content_length_over_limit_is_413():
+    stats = _stats()
+    body = b"{" + b" " * const.WEBHOOK_MAX_BODY_BYTES + b"}"
+    assert _status(asyncio.run(_check(body, SIGNED, _limiter(), stats))) == 413
+    assert stats["too_large"] == 1
+
+
+def test_chunked_body_over_limit_is_413():
+    stats = _stats()
+    body = json.dumps({"pad": "x" * const.WEBHOOK_MAX_BODY_BYTES}).encode()
+    assert _status(asyncio.run(_check(body, SIGNED, _limiter(), stats, content_length=False))) == 413
+    assert stats["too_large"] == 1
+
+
+@pytest.mark.parametrize("body", [b"not json", b'{"a": ', b"[1, 2]", b'"text"', b"\xff\xfe"])
+def test_invalid_or_non_object_json_is_400(body):
+    stats = _stats()
+    assert _status(asyncio.run(_check(body, SIGNED, _limiter(), stats))) == 400
+    assert stats["invalid_json"] == 1
+    assert stats["accepted"] == 0
+
+
+def test_limiter_evicts_least_recently_updated():
+    limiter = ratelimit.SourceRateLimiter(burst=5, refill_per_s=0.0, max_sources=2)
+    limiter.penalize("a")
+    limiter.penalize("b")
+    limiter.penalize("a")  # "a" is now the most recently updated
+    limiter.penalize("c")
+    assert list(limiter._buckets) == ["a", "c"]
+
+
+def test_limiter_refill():
+    limiter = ratelimit.SourceRateLimiter(burst=1, refill_per_s=1000.0)
+    limiter.penalize("a")
+    with mock.patch.object(ratelimit.time, "monotonic", return_value=ratelimit.time.monotonic() + 1):
+        assert not limiter.is_blocked("a")